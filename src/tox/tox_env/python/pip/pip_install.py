@@ -183,10 +183,9 @@ class Pip(PythonInstallerListDependencies):
                     if old_constraint_options != constraint_options:
                         msg = f"constraint options changed: old={old_constraint_options} new={constraint_options}"
                         raise Recreate(msg)
-                args = arguments.as_root_args
-                if args:  # pragma: no branch
-                    args.extend(self.constraints.as_root_args)
-                    self._execute_installer(args, of_type)
+                if args := arguments.as_root_args:  # pragma: no branch
+                    # as_root_args is memoized by the deps object, so build a new argv rather than extending it
+                    self._execute_installer([*args, *self.constraints.as_root_args], of_type)
                     if self.constrain_package_deps and not self.use_frozen_constraints:
                         combined_constraints = new_requirements + [c.removeprefix("-c ") for c in new_constraints]
                         self.constraints_file().write_text("\n".join(combined_constraints))
@@ -124,6 +124,7 @@ class ParsedRequirement:
         self._options = options
         self._from_file = from_file
         self._lineno = lineno
+        self._str: str | None = None
 
     @property
     def requirement(self) -> Requirement | Path | str:
@@ -148,15 +149,17 @@ class ParsedRequirement:
         return f"{base.rstrip(', ')})"
 
     def __str__(self) -> str:
-        result = []
-        if self.options.get("is_constraint"):
-            result.append("-c")
-        if self.options.get("is_editable"):
-            result.append("-e")
-        result.append(str(self.requirement))
-        for hash_value in self.options.get("hash", []):
-            result.extend(("--hash", hash_value))
-        return " ".join(result)
+        if self._str is None:  # used as the de-duplication key and again when unrolled, so render it only once
+            result = []
+            if self.options.get("is_constraint"):
+                result.append("-c")
+            if self.options.get("is_editable"):
+                result.append("-e")
+            result.append(str(self.requirement))
+            for hash_value in self.options.get("hash", []):
+                result.extend(("--hash", hash_value))
+            self._str = " ".join(result)
+        return self._str
 
     def as_args(self) -> Iterator[str]:
         if self.options.get("is_editable"):
@@ -193,11 +196,13 @@ class ParsedLine:
 class RequirementsFile:
     def __init__(self, path: Path, constraint: bool) -> None:  # noqa: FBT001
         self._path = path
+        self._path_str = str(path)
         self._is_constraint: bool = constraint
         self._opt = Namespace()
         self._requirements: list[ParsedRequirement] | None = None
         self._as_root_args: list[str] | None = None
         self._parser_private: ArgumentParser | None = None
+        self._file_content: dict[str, str] = {}
 
     @property
     def _req_parser(self) -> RequirementsFile:
@@ -239,7 +244,7 @@ class RequirementsFile:
 
     def _parse_requirements(self, opt: Namespace, recurse: bool) -> list[ParsedRequirement]:  # noqa: FBT001
         result, found = [], set()
-        for parsed_line in self._parse_and_recurse(str(self._path), self.is_constraint, recurse):
+        for parsed_line in self._parse_and_recurse(self._path_str, self.is_constraint, recurse):
             if parsed_line.is_requirement:
                 parsed_req = self._handle_requirement_line(parsed_line)
                 key = str(parsed_req)
@@ -298,6 +303,11 @@ class RequirementsFile:
         :param url: file path or url
 
         """
+        if url not in self._file_content:  # files included from multiple places are fetched only once
+            self._file_content[url] = self._fetch_file_content(url)
+        return self._file_content[url]
+
+    def _fetch_file_content(self, url: str) -> str:
         scheme = get_url_scheme(url)
         if scheme in {"http", "https"}:
             with urlopen(url) as response:  # noqa: S310
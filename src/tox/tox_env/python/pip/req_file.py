@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from argparse import Namespace
 from typing import TYPE_CHECKING, cast
 
 from packaging.requirements import Requirement
@@ -14,9 +15,16 @@ _UNESCAPED_SPACE_RE = re.compile(
     """,
     re.VERBOSE,
 )
+_CONTINUATION_RE = re.compile(
+    r"""
+    \\ \r* \n   # backslash followed by a newline continues the line
+    | \r        # carriage returns are dropped
+    """,
+    re.VERBOSE,
+)
 
 if TYPE_CHECKING:
-    from argparse import ArgumentParser, Namespace
+    from argparse import ArgumentParser
     from pathlib import Path
     from typing import Final
 
@@ -24,7 +32,7 @@ if TYPE_CHECKING:
 class PythonDeps(RequirementsFile):
     # these options are valid in requirements.txt, but not via pip cli and
     # thus cannot be used in the testenv `deps` list
-    _illegal_options: Final[list[str]] = ["hash"]
+    _illegal_options: Final[frozenset[str]] = frozenset({"hash"})
 
     def __init__(self, raw: str | list[str] | list[Requirement], root: Path) -> None:
         super().__init__(root / "tox.ini", constraint=False)
@@ -59,14 +67,11 @@ class PythonDeps(RequirementsFile):
         return super()._get_file_content(url)
 
     def _is_url_self(self, url: str) -> bool:
-        return url == str(self._path)
+        return url == self._path_str
 
     def _pre_process(self, content: str) -> ReqFileLines:
         for at, line in super()._pre_process(content):
-            if line.startswith("-r") or (line.startswith("-c") and line[2].isalpha()):
-                found_line = f"{line[0:2]} {line[2:]}"  # normalize
-            else:
-                found_line = line
+            found_line = f"{line[0:2]} {line[2:]}" if _is_glued_file_option(line) else line  # normalize
             yield at, found_line
 
     def lines(self) -> list[str]:
@@ -76,7 +81,7 @@ class PythonDeps(RequirementsFile):
     def _normalize_raw(cls, raw: str) -> str:
         # a line ending in an unescaped \ is treated as a line continuation and the newline following it is effectively
         # ignored
-        raw = "".join(raw.replace("\r", "").split("\\\n"))
+        raw = _CONTINUATION_RE.sub("", raw)
         # for tox<4 supporting requirement/constraint files via -rreq.txt/-creq.txt
         lines: list[str] = [cls._normalize_line(line) for line in raw.splitlines()]
         adjusted = "\n".join(lines)
@@ -84,25 +89,13 @@ class PythonDeps(RequirementsFile):
 
     @classmethod
     def _normalize_line(cls, line: str) -> str:
-        arg_match = next(
-            (
-                arg
-                for arg in ONE_ARG
-                if line.startswith(arg)
-                and len(line) > len(arg)
-                and not (line[len(arg)].isspace() or line[len(arg)] == "=")
-            ),
-            None,
-        )
-        if arg_match is not None:
-            values = line[len(arg_match) :]
-            line = f"{arg_match} {values}"
+        if arg_match := _ONE_ARG_RE.match(line):
+            line = f"{arg_match[0]} {line[arg_match.end() :]}"
         # escape spaces
-        escape_match = next((e for e in ONE_ARG_ESCAPE if line.startswith(e) and line[len(e)].isspace()), None)
-        if escape_match is not None:
+        if escape_match := _ONE_ARG_ESCAPE_RE.match(line):
             # escape not already escaped spaces
-            escaped = _UNESCAPED_SPACE_RE.sub(r"\\\1", line[len(escape_match) + 1 :])
-            line = f"{line[: len(escape_match)]} {escaped}"
+            escaped = _UNESCAPED_SPACE_RE.sub(r"\\\1", line[escape_match.end() :])
+            line = f"{escape_match[1]} {escaped}"
         return line
 
     def _parse_requirements(self, opt: Namespace, recurse: bool) -> list[ParsedRequirement]:  # noqa: FBT001
@@ -110,12 +103,12 @@ class PythonDeps(RequirementsFile):
         # (requirements recursively included from other files are not checked)
         requirements = super()._parse_requirements(opt, recurse)
         for req in requirements:
-            if req.from_file != str(self.path):
+            if req.from_file != self._path_str:
                 continue
-            for illegal_option in self._illegal_options:
-                if req.options.get(illegal_option):
-                    msg = f"Cannot use --{illegal_option} in deps list, it must be in requirements file. ({req})"
-                    raise ValueError(msg)
+            if illegal_options := self._illegal_options & req.options.keys():
+                options = ", ".join(f"--{option}" for option in sorted(illegal_options))
+                msg = f"Cannot use {options} in deps list, it must be in requirements file. ({req})"
+                raise ValueError(msg)
         return requirements
 
     def unroll(self) -> tuple[list[str], list[str]]:
@@ -131,6 +124,8 @@ class PythonDeps(RequirementsFile):
 
     def __iadd__(self, other: PythonDeps) -> PythonDeps:  # noqa: PYI034
         self._raw += "\n" + other._raw
+        # drop everything derived from the previous raw content, so it is parsed again on next access
+        self._opt, self._requirements, self._as_root_args, self._unroll = Namespace(), None, None, None
         return self
 
     @classmethod
@@ -166,14 +161,11 @@ class PythonConstraints(RequirementsFile):
         return super()._get_file_content(url)
 
     def _is_url_self(self, url: str) -> bool:
-        return url == str(self._path)
+        return url == self._path_str
 
     def _pre_process(self, content: str) -> ReqFileLines:
         for at, line in super()._pre_process(content):
-            if line.startswith("-r") or (line.startswith("-c") and line[2].isalpha()):
-                found_line = f"{line[0:2]} {line[2:]}"  # normalize
-            else:
-                found_line = line
+            found_line = f"{line[0:2]} {line[2:]}" if _is_glued_file_option(line) else line  # normalize
             yield at, found_line
 
     def lines(self) -> list[str]:
@@ -183,7 +175,7 @@ class PythonConstraints(RequirementsFile):
     def _normalize_raw(cls, raw: str) -> str:
         # a line ending in an unescaped \ is treated as a line continuation and the newline following it is effectively
         # ignored
-        raw = "".join(raw.replace("\r", "").split("\\\n"))
+        raw = _CONTINUATION_RE.sub("", raw)
         # for tox<4 supporting requirement/constraint files via -rreq.txt/-creq.txt
         lines: list[str] = [cls._normalize_line(line) for line in raw.splitlines()]
 
@@ -196,25 +188,13 @@ class PythonConstraints(RequirementsFile):
 
     @classmethod
     def _normalize_line(cls, line: str) -> str:
-        arg_match = next(
-            (
-                arg
-                for arg in ONE_ARG
-                if line.startswith(arg)
-                and len(line) > len(arg)
-                and not (line[len(arg)].isspace() or line[len(arg)] == "=")
-            ),
-            None,
-        )
-        if arg_match is not None:
-            values = line[len(arg_match) :]
-            line = f"{arg_match} {values}"
+        if arg_match := _ONE_ARG_RE.match(line):
+            line = f"{arg_match[0]} {line[arg_match.end() :]}"
         # escape spaces
-        escape_match = next((e for e in ONE_ARG_ESCAPE if line.startswith(e) and line[len(e)].isspace()), None)
-        if escape_match is not None:
+        if escape_match := _ONE_ARG_ESCAPE_RE.match(line):
             # escape not already escaped spaces
-            escaped = _UNESCAPED_SPACE_RE.sub(r"\\\1", line[len(escape_match) + 1 :])
-            line = f"{line[: len(escape_match)]} {escaped}"
+            escaped = _UNESCAPED_SPACE_RE.sub(r"\\\1", line[escape_match.end() :])
+            line = f"{escape_match[1]} {escaped}"
         return line
 
     def _parse_requirements(self, opt: Namespace, recurse: bool) -> list[ParsedRequirement]:  # noqa: FBT001
@@ -222,7 +202,7 @@ class PythonConstraints(RequirementsFile):
         # (requirements recursively included from other files are not checked)
         requirements = super()._parse_requirements(opt, recurse)
         for req in requirements:
-            if req.from_file != str(self.path):
+            if req.from_file != self._path_str:
                 continue
             if req.options:
                 msg = f"Cannot provide options in constraints list, only paths or URL can be provided. ({req})"
@@ -291,6 +271,33 @@ ONE_ARG_ESCAPE = {
     "--editable",
 }
 
+
+def _one_of(options: set[str]) -> str:
+    # longest first, so that an option is never shadowed by a shorter one it starts with
+    return "|".join(re.escape(option) for option in sorted(options, key=len, reverse=True))
+
+
+_ONE_ARG_RE = re.compile(
+    rf"""
+    ^ ( {_one_of(ONE_ARG)} )  # option
+    (?= [^\s=] )              # directly followed by its value
+    """,
+    re.VERBOSE,
+)
+_ONE_ARG_ESCAPE_RE = re.compile(
+    rf"""
+    ^ ( {_one_of(ONE_ARG_ESCAPE)} )  # option
+    \s                               # followed by a separator
+    """,
+    re.VERBOSE,
+)
+
+
+def _is_glued_file_option(line: str) -> bool:
+    # -rreq.txt, or -creq.txt when a letter follows; slicing keeps a bare -c from raising IndexError
+    return line.startswith("-r") or (line.startswith("-c") and line[2:3].isalpha())
+
+
 __all__ = (
     "ONE_ARG",
     "PythonDeps",
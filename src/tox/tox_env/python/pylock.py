@@ -1,23 +1,41 @@
 from __future__ import annotations
 
+import json
+import re
 import sys
+from contextlib import suppress
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING
 
-from packaging.pylock import Package, PylockValidationError
-from packaging.pylock import Pylock as PackagingPylock
+from packaging import __version__ as packaging_version
 from packaging.requirements import Requirement
+from packaging.specifiers import SpecifierSet
 
 from tox.tox_env.errors import Fail
+from tox.version import version as tox_version
 
 if TYPE_CHECKING:
+    from os import stat_result
     from pathlib import Path
 
+    from packaging.markers import Marker
+    from packaging.pylock import Pylock as PackagingPylock
+    from packaging.version import Version
+
 if sys.version_info >= (3, 11):  # pragma: no cover
     import tomllib
 else:  # pragma: no cover
     import tomli as tomllib
 
+_PIN_RE = re.compile(
+    r"""
+    (?P<name> [A-Za-z0-9] ( [A-Za-z0-9._-]* [A-Za-z0-9] )? )  # project name
+    ( == (?P<version> [A-Za-z0-9.!+_-]+ ) )?                  # optional exact version
+    """,
+    re.VERBOSE,
+)
+
 
 @dataclass(frozen=True, kw_only=True)
 class Pylock:
@@ -25,32 +43,96 @@ class Pylock:
     extras: frozenset[str] = frozenset()
     groups: frozenset[str] = frozenset()
     marker_env: dict[str, str] = field(default_factory=dict)
+    cache_file: Path | None = None  #: where to persist the resolved requirements between runs
 
     def requirements(self) -> list[Requirement]:
-        with self.path.open("rb") as fh:
-            data = tomllib.load(fh)
+        key = self._cache_key(stat := self.path.stat())
+        if (cached := self._load_cache(key)) is not None:
+            return cached
+        from packaging.pylock import PylockValidationError  # noqa: PLC0415
+
         try:
-            parsed = PackagingPylock.from_dict(data)
-        except PylockValidationError as exc:
+            parsed = _load_lock(self.path, stat.st_mtime_ns, stat.st_size)
+        except (PylockValidationError, tomllib.TOMLDecodeError, UnicodeDecodeError) as exc:
             msg = f"invalid pylock file {self.path}: {exc}"
             raise Fail(msg) from exc
+        verdicts: dict[str, bool] = {}  # lock files repeat a handful of markers across many packages
+        result = [
+            _requirement(pkg.name, pkg.version)
+            for pkg in parsed.packages
+            if pkg.marker is None or self._evaluate(pkg.marker, verdicts)
+        ]
+        self._store_cache(key, result)
+        return result
+
+    @cached_property
+    def _marker_environment(self) -> dict[str, str | frozenset[str]]:
         env: dict[str, str | frozenset[str]] = {**self.marker_env}
         if self.extras:
             env["extras"] = self.extras
         if self.groups:
             env["dependency_groups"] = self.groups
-        return [
-            self._to_requirement(pkg)
-            for pkg in parsed.packages
-            if pkg.marker is None or pkg.marker.evaluate(env, context="lock_file")
-        ]
+        return env
+
+    def _evaluate(self, marker: Marker, verdicts: dict[str, bool]) -> bool:
+        if (key := str(marker)) not in verdicts:
+            verdicts[key] = marker.evaluate(self._marker_environment, context="lock_file")
+        return verdicts[key]
+
+    def _cache_key(self, stat: stat_result) -> str:
+        selection = {
+            "path": str(self.path),  # the setting may be pointed at another lock with the same mtime and size
+            "extras": sorted(self.extras),
+            "groups": sorted(self.groups),
+            "marker_env": self.marker_env,
+            # the selection is made by this code, so an upgrade must not reuse what an older version selected
+            "tox": tox_version,
+            "packaging": packaging_version,
+        }
+        return f"{stat.st_mtime_ns}:{stat.st_size}:{json.dumps(selection, sort_keys=True)}"
+
+    def _load_cache(self, key: str) -> list[Requirement] | None:
+        if self.cache_file is None:
+            return None
+        try:
+            header, *lines = self.cache_file.read_text(encoding="utf-8").splitlines()
+            if header != key:
+                return None
+            return [_cached_requirement(line) for line in lines]
+        except (ValueError, OSError):
+            return None
+
+    def _store_cache(self, key: str, requirements: list[Requirement]) -> None:
+        if self.cache_file is None:
+            return
+        with suppress(OSError):  # the cache is an optimization, failing to write it must not fail the run
+            self.cache_file.write_text("\n".join([key, *(str(req) for req in requirements)]), encoding="utf-8")
+
+
+@lru_cache(maxsize=32)
+def _load_lock(path: Path, mtime_ns: int, size: int) -> PackagingPylock:  # noqa: ARG001
+    # keyed on the file's stat, so environments sharing a lock file within a run parse and validate it once, while
+    # an edited file is loaded again; only environments that use a lock file pay for importing the lock file model
+    from packaging.pylock import Pylock as PackagingPylock  # noqa: PLC0415
+
+    return PackagingPylock.from_dict(tomllib.loads(path.read_bytes().decode("utf-8")))
+
+
+def _cached_requirement(line: str) -> Requirement:
+    if match := _PIN_RE.fullmatch(line):
+        return _requirement(match["name"], match["version"])
+    return Requirement(line)  # not a shape we write, let the requirement grammar judge it
+
 
-    @staticmethod
-    def _to_requirement(pkg: Package) -> Requirement:
-        req_str = str(pkg.name)
-        if pkg.version is not None:
-            req_str += f"=={pkg.version}"
-        return Requirement(req_str)
+def _requirement(name: str, version: Version | str | None) -> Requirement:
+    # the version is already validated, so parse only the bare name and attach the pin instead of running the
+    # requirement grammar over it; the name is interned as every environment reading the same lock (or its cache)
+    # would otherwise hold its own copy
+    req = Requirement(name)
+    req.name = sys.intern(req.name)
+    if version is not None:
+        req.specifier = SpecifierSet(f"=={version}")
+    return req
 
 
 __all__ = [
@@ -186,7 +186,13 @@ class PythonRun(Python, RunToxEnv, ABC):
         }
         extras: set[str] = self.conf["extras"]
         groups: set[str] = self.conf["dependency_groups"]
-        pylock = Pylock(path=path, extras=frozenset(extras), groups=frozenset(groups), marker_env=marker_env)
+        pylock = Pylock(
+            path=path,
+            extras=frozenset(extras),
+            groups=frozenset(groups),
+            marker_env=marker_env,
+            cache_file=self.env_dir / "pylock.cache",
+        )
         self._install(pylock, PythonRun.__name__, "pylock")
 
     def _setup_with_env(self) -> None:
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from shutil import rmtree
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-_CACHEDIR_TAG = """\
+_CACHEDIR_TAG: Final[bytes] = b"""\
 Signature: 8a477f597d28d172789f06886806bc55
 # This file is a cache directory tag created by tox.
 # For information about cache directory tags, see:
@@ -16,22 +18,37 @@ Signature: 8a477f597d28d172789f06886806bc55
 
 def ensure_cachedir_tag(work_dir: Path) -> None:
     """Ensure a ``CACHEDIR.TAG`` file exists in *work_dir* per https://bford.info/cachedir/spec.html."""
-    tag_path = work_dir / "CACHEDIR.TAG"
-    if not tag_path.exists():
-        work_dir.mkdir(parents=True, exist_ok=True)
-        tag_path.write_text(_CACHEDIR_TAG, encoding="utf-8")
+    try:  # create exclusively, so an existing tag costs one failed open instead of a stat and is never overwritten
+        fd = _create_new(work_dir / "CACHEDIR.TAG")
+    except FileExistsError:
+        return
+    with os.fdopen(fd, "wb") as file_handler:
+        file_handler.write(_CACHEDIR_TAG)
+
+
+def _create_new(path: Path) -> int:
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+    try:
+        return os.open(path, flags, 0o666)  # the umask decides the final mode, as with any other write
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(path, flags, 0o666)
 
 
 def ensure_empty_dir(path: Path, except_filename: str | None = None) -> None:
     if path.exists():
         if path.is_dir():
-            for sub_path in path.iterdir():
-                if sub_path.name == except_filename:
-                    continue
-                if sub_path.is_dir():
-                    rmtree(sub_path, ignore_errors=True)
+            # directory entries carry their type, so no stat is needed per child; read them all before removing any, as
+            # deleting while the directory is being read may make some file systems skip entries
+            with os.scandir(path) as scandir_it:
+                entries = [entry for entry in scandir_it if entry.name != except_filename]
+            sub_dirs: list[str] = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    sub_dirs.append(entry.path)
                 else:
-                    sub_path.unlink()
+                    os.unlink(entry.path)  # noqa: PTH108
+            _remove_dirs(sub_dirs)
         else:
             path.unlink()
             path.mkdir()
@@ -39,6 +56,17 @@ def ensure_empty_dir(path: Path, except_filename: str | None = None) -> None:
         path.mkdir(parents=True)
 
 
+def _remove_dirs(paths: list[str]) -> None:
+    if len(paths) <= 1:
+        for path in paths:
+            rmtree(path, ignore_errors=True)
+        return
+    # deleting a tree is syscall bound and the GIL is released around those, so trees are removed concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(paths)), thread_name_prefix="tox-rmtree") as executor:
+        for path in paths:
+            executor.submit(rmtree, path, ignore_errors=True)
+
+
 def ensure_gitignore(path: Path) -> None:
     """Create a ``.gitignore`` file with ``*`` in the given directory if one does not already exist.
 
@@ -529,6 +529,18 @@ def test_req_over_http_has_req(tmp_path: Path, mocker: MockerFixture) -> None:
     assert found == ["a"]
 
 
+def test_req_file_content_fetched_once(tmp_path: Path, mocker: MockerFixture) -> None:
+    url_open = mocker.patch("tox.tox_env.python.pip.req.file.urlopen", autospec=True)
+    url_open.side_effect = lambda _: BytesIO(b"a")
+    requirements_txt = tmp_path / "req.txt"
+    requirements_txt.write_text("-r https://root.org/a.txt\n-c https://root.org/a.txt")
+    req_file = RequirementsFile(requirements_txt, constraint=False)
+
+    assert [str(i) for i in req_file.requirements] == ["a", "-c a"]
+    assert req_file.as_root_args == ["-r", "https://root.org/a.txt", "-c", "https://root.org/a.txt"]
+    assert url_open.call_count == 1
+
+
 @pytest.mark.parametrize(
     "loc",
     ["file://", "file://localhost"],
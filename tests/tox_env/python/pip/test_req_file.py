@@ -20,6 +20,22 @@ def test_legacy_requirement_file(tmp_path: Path, legacy_flag: str) -> None:
     assert [str(i) for i in python_deps.requirements] == ["b" if legacy_flag == "-r" else "-c b"]
 
 
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        pytest.param("-rreq.txt", "-r req.txt", id="requirement"),
+        pytest.param("-creq.txt", "-c req.txt", id="constraint"),
+        pytest.param("-cé.txt", "-c é.txt", id="constraint-non-ascii-letter"),
+        pytest.param("-c²a.txt", "-c²a.txt", id="constraint-superscript-digit"),
+        pytest.param("-c1.txt", "-c1.txt", id="constraint-digit"),
+        pytest.param("-c", "-c", id="constraint-bare"),
+    ],
+)
+def test_legacy_glued_file_option(tmp_path: Path, line: str, expected: str) -> None:
+    found = [found_line for _, found_line in PythonDeps("", tmp_path)._pre_process(line)]  # noqa: SLF001
+    assert found == [expected]
+
+
 def test_deps_with_hash(tmp_path: Path) -> None:
     """deps with --hash should raise an exception."""
     python_deps = PythonDeps(
@@ -76,6 +92,15 @@ def test_req_iadd(tmp_path: Path) -> None:
     assert a.lines() == ["foo", "bar"]
 
 
+def test_req_iadd_after_parse(tmp_path: Path) -> None:
+    a = PythonDeps(raw="foo\n--pre", root=tmp_path)
+    assert a.as_root_args == ["foo", "--pre"]
+    assert a.unroll() == (["pre=True"], ["foo"])
+    a += PythonDeps(raw="bar", root=tmp_path)
+    assert a.as_root_args == ["bar", "foo", "--pre"]
+    assert a.unroll() == (["pre=True"], ["bar", "foo"])
+
+
 def test_deps_factory_invalid_list(tmp_path: Path) -> None:
     with pytest.raises(TypeError, match="deps expected str, list\\[str\\], or list\\[Requirement\\]") as exc_info:
         PythonDeps.factory(tmp_path, ["ok", 42, "also-ok"])
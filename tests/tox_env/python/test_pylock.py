@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import os
 import sys
 from textwrap import dedent
 from typing import TYPE_CHECKING
 
 import pytest
+from packaging.requirements import Requirement
+from packaging.version import Version
 
 from tox.tox_env.errors import Fail
-from tox.tox_env.python.pylock import Pylock
+from tox.tox_env.python.pylock import Pylock, _requirement, tomllib  # noqa: PLC2701
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
+
     from tox.pytest import ToxProjectCreator
 
 PYLOCK_TOML = dedent("""\
@@ -194,6 +199,30 @@ def test_pylock_no_reinstall_on_rerun(tox_project: ToxProjectCreator) -> None:
     assert not execute_calls.call_args_list
 
 
+def test_pylock_reuses_cache_on_rerun(tox_project: ToxProjectCreator, mocker: MockerFixture) -> None:
+    project = tox_project(
+        {
+            "tox.toml": """
+            [env_run_base]
+            skip_install = true
+            pylock = "pylock.toml"
+            """,
+            "pylock.toml": PYLOCK_TOML,
+        },
+    )
+    project.patch_execute()
+    result = project.run("r", "-e", "py")
+    result.assert_success()
+    cache_file = project.path / ".tox" / "py" / "pylock.cache"
+    assert cache_file.read_text(encoding="utf-8").splitlines()[1:] == ["alpha==1.0.0", "beta==2.0.0"]
+
+    load_lock = mocker.patch("tox.tox_env.python.pylock._load_lock", side_effect=AssertionError("lock file parsed"))
+    result_second = project.run("r", "-e", "py")
+    result_second.assert_success()
+    load_lock.assert_not_called()
+    assert (project.path / ".tox" / "py" / "pylock.txt").read_text() == "alpha==1.0.0\nbeta==2.0.0"
+
+
 def test_pylock_filters_by_extras(tox_project: ToxProjectCreator) -> None:
     project = tox_project(
         {
@@ -377,6 +406,84 @@ def test_pylock_requirements(tmp_path: Path) -> None:
     assert result == ["alpha==1.0.0", "beta==2.0.0"]
 
 
+def test_pylock_requirements_cache(tmp_path: Path) -> None:
+    lock_file, cache_file = tmp_path / "pylock.toml", tmp_path / "pylock.cache"
+    lock_file.write_text(PYLOCK_TOML)
+    pylock = Pylock(path=lock_file, cache_file=cache_file)
+
+    assert [str(r) for r in pylock.requirements()] == ["alpha==1.0.0", "beta==2.0.0"]
+    header = cache_file.read_text(encoding="utf-8").splitlines()[0]
+    cache_file.write_text(f"{header}\ngamma==3.0.0\ndelta>=1", encoding="utf-8")
+    assert [str(r) for r in pylock.requirements()] == ["gamma==3.0.0", "delta>=1"]
+    cache_file.write_text(f"{header}\nnot a requirement", encoding="utf-8")
+    assert [str(r) for r in pylock.requirements()] == ["alpha==1.0.0", "beta==2.0.0"]
+
+    lock_file.write_text(f"{PYLOCK_TOML}# regenerated\n")
+    assert [str(r) for r in pylock.requirements()] == ["alpha==1.0.0", "beta==2.0.0"]
+
+
+@pytest.mark.parametrize("component", ["tox_version", "packaging_version"])
+def test_pylock_requirements_cache_invalidated_by_upgrade(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, component: str
+) -> None:
+    lock_file, cache_file = tmp_path / "pylock.toml", tmp_path / "pylock.cache"
+    lock_file.write_text(PYLOCK_TOML)
+    pylock = Pylock(path=lock_file, cache_file=cache_file)
+    pylock.requirements()
+    header = cache_file.read_text(encoding="utf-8").splitlines()[0]
+    cache_file.write_text(f"{header}\ngamma==3.0.0", encoding="utf-8")
+
+    monkeypatch.setattr(f"tox.tox_env.python.pylock.{component}", "999.0")
+    assert [str(r) for r in pylock.requirements()] == ["alpha==1.0.0", "beta==2.0.0"]
+    assert '"999.0"' in cache_file.read_text(encoding="utf-8").splitlines()[0]
+
+
+def test_pylock_requirements_cache_other_lock_same_stat(tmp_path: Path) -> None:
+    first, second, cache_file = tmp_path / "a.toml", tmp_path / "b.toml", tmp_path / "pylock.cache"
+    first.write_text(PYLOCK_TOML)
+    second.write_text(PYLOCK_TOML.replace("alpha", "gamma"))
+    stat = first.stat()
+    os.utime(second, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert second.stat().st_size == stat.st_size
+
+    assert [str(r) for r in Pylock(path=first, cache_file=cache_file).requirements()] == ["alpha==1.0.0", "beta==2.0.0"]
+    found = [str(r) for r in Pylock(path=second, cache_file=cache_file).requirements()]
+    assert found == ["gamma==1.0.0", "beta==2.0.0"]
+
+
+def test_pylock_requirements_parses_shared_lock_once(tmp_path: Path, mocker: MockerFixture) -> None:
+    lock_file = tmp_path / "pylock.toml"
+    lock_file.write_text(PYLOCK_TOML)
+    loads = mocker.spy(tomllib, "loads")
+
+    first = [str(r) for r in Pylock(path=lock_file).requirements()]
+    second = [str(r) for r in Pylock(path=lock_file, extras=frozenset({"docs"})).requirements()]
+
+    assert first == second == ["alpha==1.0.0", "beta==2.0.0"]
+    assert loads.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("name", "version"),
+    [
+        pytest.param("alpha", None, id="unpinned"),
+        pytest.param("alpha", "1.0.0", id="release"),
+        pytest.param("Zope.Interface_x", "1!2.0rc1.post3.dev4+local.7", id="complex"),
+        pytest.param("beta", Version("2.0"), id="version-object"),
+    ],
+)
+def test_pylock_requirement_matches_parsed(name: str, version: Version | str | None) -> None:
+    built = _requirement(name, version)
+    parsed = Requirement(name if version is None else f"{name}=={version}")
+
+    assert built == parsed
+    assert hash(built) == hash(parsed)
+    assert str(built) == str(parsed)
+    assert repr(built) == repr(parsed)
+    for attr in ("name", "url", "extras", "specifier", "marker"):
+        assert getattr(built, attr) == getattr(parsed, attr), attr
+
+
 def test_pylock_requirements_filters_extras(tmp_path: Path) -> None:
     lock_file = tmp_path / "pylock.toml"
     lock_file.write_text(
@@ -430,6 +537,15 @@ def test_pylock_requirements_invalid(tmp_path: Path) -> None:
         pylock.requirements()
 
 
+def test_pylock_requirements_invalid_toml_syntax(tmp_path: Path) -> None:
+    lock_file = tmp_path / "pylock.toml"
+    lock_file.write_text('lock-version = "1.0\n')
+    pylock = Pylock(path=lock_file)
+
+    with pytest.raises(Fail, match="invalid pylock file"):
+        pylock.requirements()
+
+
 @pytest.mark.slow
 @pytest.mark.integration
 def test_pylock_install_integration(
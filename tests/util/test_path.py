@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import os
+import stat
+import sys
 from typing import TYPE_CHECKING
 
+import pytest
+
 from tox.util.path import ensure_cachedir_tag, ensure_empty_dir, ensure_gitignore
 
 if TYPE_CHECKING:
@@ -30,6 +35,16 @@ def test_ensure_cachedir_tag_creates_parent_dirs(tmp_path: Path) -> None:
     assert (nested / "CACHEDIR.TAG").is_file()
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_ensure_cachedir_tag_honors_umask(tmp_path: Path) -> None:
+    previous = os.umask(0o002)
+    try:
+        ensure_cachedir_tag(tmp_path)
+    finally:
+        os.umask(previous)
+    assert stat.S_IMODE((tmp_path / "CACHEDIR.TAG").stat().st_mode) == 0o664
+
+
 def test_ensure_cachedir_tag_idempotent(tmp_path: Path) -> None:
     ensure_cachedir_tag(tmp_path)
     tag = tmp_path / "CACHEDIR.TAG"
@@ -53,6 +68,31 @@ def test_ensure_empty_dir_file(tmp_path: Path) -> None:
     assert not list(dest.iterdir())
 
 
+def test_ensure_empty_dir_content(tmp_path: Path) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / name / "nested").mkdir(parents=True)
+        (tmp_path / name / "nested" / "file").write_text("")
+    (tmp_path / "file").write_text("")
+    (tmp_path / "file.lock").write_text("")
+    ensure_empty_dir(tmp_path, except_filename="file.lock")
+    assert [p.name for p in tmp_path.iterdir()] == ["file.lock"]
+
+
+def test_ensure_empty_dir_symlink_to_dir(tmp_path: Path) -> None:
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "keep").write_text("")
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    try:
+        (dest / "link").symlink_to(target, target_is_directory=True)
+    except OSError:  # pragma: no cover
+        pytest.skip("symlinks not supported")
+    ensure_empty_dir(dest)
+    assert not list(dest.iterdir())
+    assert (target / "keep").exists()
+
+
 def test_ensure_gitignore_creates_file(tmp_path: Path) -> None:
     target = tmp_path / "work"
     target.mkdir()